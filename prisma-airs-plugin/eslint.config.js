@@ -18,6 +18,7 @@ export default [
         fetch: "readonly",
         Response: "readonly",
         Date: "readonly",
+        performance: "readonly",
         Promise: "readonly",
         Record: "readonly",
         setTimeout: "readonly",
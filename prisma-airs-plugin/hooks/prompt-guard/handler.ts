@@ -7,7 +7,7 @@
  */
 
 import { scan } from "../../src/scanner.ts";
-import type { PrismaAirsConfig } from "../../src/config.ts";
+import { getHookConfig } from "../../src/config.ts";
 
 interface PluginApi {
   on: (event: string, handler: (...args: any[]) => any) => void;
@@ -18,15 +18,6 @@ interface HookCtxFn {
   (ctx: any): any;
 }
 
-function getConfig(ctx: any): { profileName: string; appName: string; failClosed: boolean } {
-  const cfg: PrismaAirsConfig | undefined = ctx.cfg?.plugins?.entries?.["prisma-airs"]?.config;
-  return {
-    profileName: cfg?.profile_name ?? "default",
-    appName: cfg?.app_name ?? "openclaw",
-    failClosed: cfg?.fail_closed ?? true,
-  };
-}
-
 function extractLatestUserMessage(event: any): string | undefined {
   if (event.messages && Array.isArray(event.messages) && event.messages.length > 0) {
     for (let i = event.messages.length - 1; i >= 0; i--) {
@@ -65,7 +56,7 @@ export function registerPromptGuardHooks(api: PluginApi, hookCtx: HookCtxFn): nu
   api.on(
     "before_prompt_build",
     async (event: any, ctx: any): Promise<{ prependSystemContext?: string } | void> => {
-      const config = getConfig(hookCtx(ctx));
+      const config = getHookConfig(hookCtx(ctx));
       const content = extractLatestUserMessage(event);
       if (!content) return;
 
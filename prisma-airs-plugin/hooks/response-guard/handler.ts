@@ -8,7 +8,7 @@
 
 import { scan, type ScanResult } from "../../src/scanner.ts";
 import { maskSensitiveData } from "../../src/dlp.ts";
-import type { PrismaAirsConfig } from "../../src/config.ts";
+import { getHookConfig } from "../../src/config.ts";
 
 interface PluginApi {
   on: (event: string, handler: (...args: any[]) => any) => void;
@@ -19,9 +19,12 @@ interface HookCtxFn {
   (ctx: any): any;
 }
 
-const MASKABLE_CATEGORIES = ["dlp_response", "dlp_prompt", "dlp"];
+const MASKABLE_CATEGORIES: ReadonlySet<string> = new Set(["dlp_response", "dlp_prompt", "dlp"]);
 
-const ALWAYS_BLOCK_CATEGORIES = [
+// Clean verdicts that may accompany a maskable category without needing action
+const CLEAN_CATEGORIES: ReadonlySet<string> = new Set(["safe", "benign"]);
+
+const ALWAYS_BLOCK_CATEGORIES: ReadonlySet<string> = new Set([
   "malicious_code",
   "malicious_code_prompt",
   "malicious_code_response",
@@ -37,35 +40,20 @@ const ALWAYS_BLOCK_CATEGORIES = [
   "db_security",
   "db_security_response",
   "scan-failure",
-];
-
-function getConfig(ctx: any): {
-  profileName: string;
-  appName: string;
-  failClosed: boolean;
-  dlpMaskOnly: boolean;
-} {
-  const cfg: PrismaAirsConfig | undefined = ctx.cfg?.plugins?.entries?.["prisma-airs"]?.config;
-  return {
-    profileName: cfg?.profile_name ?? "default",
-    appName: cfg?.app_name ?? "openclaw",
-    failClosed: cfg?.fail_closed ?? true,
-    dlpMaskOnly: cfg?.dlp_mask_only ?? true,
-  };
-}
+]);
 
 function shouldMaskOnly(result: ScanResult, dlpMaskOnly: boolean): boolean {
   if (!dlpMaskOnly) return false;
-  if (result.categories.some((cat) => ALWAYS_BLOCK_CATEGORIES.includes(cat))) return false;
+  if (result.categories.some((cat) => ALWAYS_BLOCK_CATEGORIES.has(cat))) return false;
   return result.categories.every(
-    (cat) => MASKABLE_CATEGORIES.includes(cat) || cat === "safe" || cat === "benign"
+    (cat) => MASKABLE_CATEGORIES.has(cat) || CLEAN_CATEGORIES.has(cat)
   );
 }
 
 function buildBlockMessage(result: ScanResult): string {
   const reasons = result.categories
     .map((cat) => cat.replace(/_/g, " "))
-    .filter((r) => r !== "safe" && r !== "benign")
+    .filter((r) => !CLEAN_CATEGORIES.has(r))
     .join(", ");
   return (
     `I apologize, but I'm unable to provide that response due to security policy` +
@@ -78,7 +66,7 @@ export function registerResponseGuardHooks(api: PluginApi, hookCtx: HookCtxFn):
   api.on(
     "message_sending",
     async (event: any, ctx: any): Promise<{ content?: string; cancel?: boolean } | void> => {
-      const config = getConfig(hookCtx(ctx));
+      const config = getHookConfig(hookCtx(ctx));
       const content = event.content;
       if (!content || typeof content !== "string" || content.trim().length === 0) return;
       const sessionKey = event.metadata?.sessionKey || ctx.conversationId || "unknown";
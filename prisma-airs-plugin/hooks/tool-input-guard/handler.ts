@@ -6,7 +6,7 @@
  */
 
 import { scan } from "../../src/scanner.ts";
-import type { PrismaAirsConfig } from "../../src/config.ts";
+import { getHookConfig } from "../../src/config.ts";
 
 interface PluginApi {
   on: (event: string, handler: (...args: any[]) => any) => void;
@@ -17,21 +17,12 @@ interface HookCtxFn {
   (ctx: any): any;
 }
 
-function getConfig(ctx: any): { profileName: string; appName: string; failClosed: boolean } {
-  const cfg: PrismaAirsConfig | undefined = ctx.cfg?.plugins?.entries?.["prisma-airs"]?.config;
-  return {
-    profileName: cfg?.profile_name ?? "default",
-    appName: cfg?.app_name ?? "openclaw",
-    failClosed: cfg?.fail_closed ?? true,
-  };
-}
-
 export function registerToolInputGuardHooks(api: PluginApi, hookCtx: HookCtxFn): number {
   api.on(
     "before_tool_call",
     async (event: any, ctx: any): Promise<{ block?: boolean; blockReason?: string } | void> => {
       if (!event.toolName) return;
-      const config = getConfig(hookCtx(ctx));
+      const config = getHookConfig(hookCtx(ctx));
       const sessionKey = ctx.sessionKey || ctx.conversationId || "unknown";
       const inputStr = event.params ? JSON.stringify(event.params) : undefined;
 
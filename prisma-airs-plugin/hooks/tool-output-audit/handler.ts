@@ -6,7 +6,7 @@
  */
 
 import { scan } from "../../src/scanner.ts";
-import type { PrismaAirsConfig } from "../../src/config.ts";
+import { getHookConfig } from "../../src/config.ts";
 
 interface PluginApi {
   on: (event: string, handler: (...args: any[]) => any) => void;
@@ -17,14 +17,6 @@ interface HookCtxFn {
   (ctx: any): any;
 }
 
-function getConfig(ctx: any): { profileName: string; appName: string } {
-  const cfg: PrismaAirsConfig | undefined = ctx.cfg?.plugins?.entries?.["prisma-airs"]?.config;
-  return {
-    profileName: cfg?.profile_name ?? "default",
-    appName: cfg?.app_name ?? "openclaw",
-  };
-}
-
 function serializeResult(result: unknown): string | undefined {
   if (result === undefined || result === null) return undefined;
   if (typeof result === "string") return result;
@@ -37,7 +29,7 @@ function serializeResult(result: unknown): string | undefined {
 
 export function registerToolOutputAuditHooks(api: PluginApi, hookCtx: HookCtxFn): number {
   api.on("after_tool_call", async (event: any, ctx: any): Promise<void> => {
-    const config = getConfig(hookCtx(ctx));
+    const config = getHookConfig(hookCtx(ctx));
     const sessionKey = ctx.sessionKey ?? "unknown";
     const resultStr = serializeResult(event.result);
     if (!resultStr || !resultStr.trim()) return;
@@ -13,6 +13,7 @@ vi.mock("@cdot65/prisma-airs-sdk", () => ({
 
 vi.mock("./src/scanner.ts", () => ({
   scan: vi.fn(),
+  scanMany: vi.fn(),
   isConfigured: vi.fn().mockReturnValue(true),
 }));
 
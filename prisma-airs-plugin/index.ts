@@ -70,6 +70,15 @@ interface PluginApi {
   registerCli: (setup: (ctx: { program: unknown }) => void, opts: { commands: string[] }) => void;
 }
 
+// CLI severity badges
+const SEVERITY_LABELS: Readonly<Record<string, string>> = {
+  SAFE: "OK",
+  LOW: "--",
+  MEDIUM: "!",
+  HIGH: "!!",
+  CRITICAL: "!!!",
+};
+
 function getRawConfig(api: PluginApi): Record<string, unknown> {
   return (api.config?.plugins?.entries?.["prisma-airs"]?.config as Record<string, unknown>) ?? {};
 }
@@ -228,22 +237,18 @@ export default function register(api: PluginApi): void {
           if (opts.json) {
             console.log(JSON.stringify(result, null, 2));
           } else {
-            const emoji: Record<string, string> = {
-              SAFE: "OK",
-              LOW: "--",
-              MEDIUM: "!",
-              HIGH: "!!",
-              CRITICAL: "!!!",
-            };
-            console.log(`[${emoji[result.severity] ?? "?"}] ${result.severity}`);
-            console.log(`Action: ${result.action}`);
+            const lines = [
+              `[${SEVERITY_LABELS[result.severity] ?? "?"}] ${result.severity}`,
+              `Action: ${result.action}`,
+            ];
             if (result.categories.length > 0)
-              console.log(`Categories: ${result.categories.join(", ")}`);
-            if (result.scanId) console.log(`Scan ID: ${result.scanId}`);
-            if (result.reportId) console.log(`Report ID: ${result.reportId}`);
-            console.log(`Profile: ${result.profileName}`);
-            console.log(`Latency: ${result.latencyMs}ms`);
-            if (result.error) console.log(`Error: ${result.error}`);
+              lines.push(`Categories: ${result.categories.join(", ")}`);
+            if (result.scanId) lines.push(`Scan ID: ${result.scanId}`);
+            if (result.reportId) lines.push(`Report ID: ${result.reportId}`);
+            lines.push(`Profile: ${result.profileName}`);
+            lines.push(`Latency: ${result.latencyMs}ms`);
+            if (result.error) lines.push(`Error: ${result.error}`);
+            console.log(lines.join("\n"));
           }
         });
     },
@@ -257,7 +262,7 @@ export const name = "Prisma AIRS Security";
 export const version = "2.1.1";
 
 // Re-exports
-export { scan, isConfigured } from "./src/scanner";
+export { scan, scanMany, isConfigured } from "./src/scanner";
 export type { ScanRequest, ScanResult } from "./src/scanner";
 export { resolveConfig } from "./src/config";
 export type { PrismaAirsConfig } from "./src/config";
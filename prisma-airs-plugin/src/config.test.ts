@@ -1,5 +1,5 @@
 import { describe, it, expect } from "vitest";
-import { resolveConfig } from "./config";
+import { resolveConfig, getHookConfig } from "./config";
 
 describe("resolveConfig", () => {
   it("returns defaults when no config provided", () => {
@@ -44,4 +44,46 @@ describe("resolveConfig", () => {
     const cfg = resolveConfig({ audit_mode: "deterministic" } as any);
     expect((cfg as any).audit_mode).toBeUndefined();
   });
+
+  it("reflects changes to the raw object on each call", () => {
+    const raw: Record<string, unknown> = { fail_closed: false };
+    expect(resolveConfig(raw).fail_closed).toBe(false);
+    raw.fail_closed = true;
+    expect(resolveConfig(raw).fail_closed).toBe(true);
+  });
+});
+
+describe("getHookConfig", () => {
+  const ctxWith = (config: Record<string, unknown>) => ({
+    cfg: { plugins: { entries: { "prisma-airs": { config } } } },
+  });
+
+  it("returns hook defaults when no plugin config present", () => {
+    expect(getHookConfig({})).toEqual({
+      profileName: "default",
+      appName: "openclaw",
+      failClosed: true,
+      dlpMaskOnly: true,
+    });
+  });
+
+  it("maps explicit plugin config values", () => {
+    const cfg = getHookConfig(
+      ctxWith({ profile_name: "p1", app_name: "app", fail_closed: false, dlp_mask_only: false })
+    );
+    expect(cfg).toEqual({
+      profileName: "p1",
+      appName: "app",
+      failClosed: false,
+      dlpMaskOnly: false,
+    });
+  });
+
+  it("picks up in-place config changes between invocations", () => {
+    const raw: Record<string, unknown> = { fail_closed: true };
+    const ctx = ctxWith(raw);
+    expect(getHookConfig(ctx).failClosed).toBe(true);
+    raw.fail_closed = false;
+    expect(getHookConfig(ctx).failClosed).toBe(false);
+  });
 });
@@ -16,14 +16,14 @@ export interface PrismaAirsConfig {
   tool_protection?: boolean;
 }
 
+export type ResolvedConfig = Required<Omit<PrismaAirsConfig, "api_key" | "profile_name">> &
+  Pick<PrismaAirsConfig, "api_key" | "profile_name">;
+
 /**
  * Resolve config with defaults applied.
  * Only returns known fields — strips any legacy or unknown fields.
  */
-export function resolveConfig(
-  raw: Record<string, unknown>
-): Required<Omit<PrismaAirsConfig, "api_key" | "profile_name">> &
-  Pick<PrismaAirsConfig, "api_key" | "profile_name"> {
+export function resolveConfig(raw: Record<string, unknown>): ResolvedConfig {
   return {
     api_key: typeof raw.api_key === "string" ? raw.api_key : undefined,
     profile_name: typeof raw.profile_name === "string" ? raw.profile_name : undefined,
@@ -35,3 +35,29 @@ export function resolveConfig(
     tool_protection: typeof raw.tool_protection === "boolean" ? raw.tool_protection : true,
   };
 }
+
+/** Settings each hook handler reads on every invocation. */
+export interface HookConfig {
+  profileName: string;
+  appName: string;
+  failClosed: boolean;
+  dlpMaskOnly: boolean;
+}
+
+const EMPTY_RAW_CONFIG: Record<string, unknown> = {};
+
+/**
+ * Resolve hook settings from a hook context (ctx.cfg is the full OpenClaw config).
+ * Read on every hook event so config changes on a running gateway apply immediately.
+ */
+export function getHookConfig(ctx: any): HookConfig {
+  const raw: Record<string, unknown> =
+    ctx?.cfg?.plugins?.entries?.["prisma-airs"]?.config ?? EMPTY_RAW_CONFIG;
+  const cfg = resolveConfig(raw);
+  return {
+    profileName: cfg.profile_name ?? "default",
+    appName: cfg.app_name,
+    failClosed: cfg.fail_closed,
+    dlpMaskOnly: cfg.dlp_mask_only,
+  };
+}
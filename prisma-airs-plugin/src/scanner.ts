@@ -146,6 +146,41 @@ export interface ScanResult {
   completedAt?: string;
 }
 
+/** AIRS action verdict -> plugin action (anything else is "allow") */
+const AIRS_ACTION_MAP: ReadonlyMap<string, Action> = new Map<string, Action>([
+  ["block", "block"],
+  ["alert", "warn"],
+]);
+
+/** AIRS category -> severity; other categories fall back to detection flags */
+const CATEGORY_SEVERITY: ReadonlyMap<string, Severity> = new Map<string, Severity>([
+  ["malicious", "CRITICAL"],
+  ["suspicious", "HIGH"],
+]);
+
+/** Prompt detection flag -> category label, in reporting order */
+const PROMPT_CATEGORIES: ReadonlyArray<readonly [keyof PromptDetected, string]> = [
+  ["injection", "prompt_injection"],
+  ["dlp", "dlp_prompt"],
+  ["urlCats", "url_filtering_prompt"],
+  ["toxicContent", "toxic_content_prompt"],
+  ["maliciousCode", "malicious_code_prompt"],
+  ["agent", "agent_threat_prompt"],
+  ["topicViolation", "topic_violation_prompt"],
+];
+
+/** Response detection flag -> category label, in reporting order */
+const RESPONSE_CATEGORIES: ReadonlyArray<readonly [keyof ResponseDetected, string]> = [
+  ["dlp", "dlp_response"],
+  ["urlCats", "url_filtering_response"],
+  ["dbSecurity", "db_security_response"],
+  ["toxicContent", "toxic_content_response"],
+  ["maliciousCode", "malicious_code_response"],
+  ["agent", "agent_threat_response"],
+  ["ungrounded", "ungrounded_response"],
+  ["topicViolation", "topic_violation_response"],
+];
+
 /** Default prompt detection flags (all false) */
 export function defaultPromptDetected(): PromptDetected {
   return {
@@ -173,6 +208,15 @@ export function defaultResponseDetected(): ResponseDetected {
   };
 }
 
+// A single SDK Scanner is reused for every scan — it carries no per-request
+// state, so there is no reason to allocate one per call on the hot path.
+let sdkScanner: SDKScanner | undefined;
+
+function getSdkScanner(): SDKScanner {
+  sdkScanner ??= new SDKScanner();
+  return sdkScanner;
+}
+
 /**
  * Scan content through Prisma AIRS API using the SDK
  */
@@ -197,7 +241,28 @@ export async function scan(request: ScanRequest): Promise<ScanResult> {
     };
   }
 
-  const startTime = Date.now();
+  // Nothing to scan — answer locally instead of spending an AIRS round trip
+  if (!request.prompt && !request.response && !request.toolEvents?.length) {
+    return {
+      action: "allow",
+      severity: "SAFE",
+      categories: ["safe"],
+      scanId: "",
+      reportId: "",
+      profileName,
+      promptDetected: defaultPromptDetected(),
+      responseDetected: defaultResponseDetected(),
+      sessionId: request.sessionId,
+      trId: request.trId,
+      latencyMs: 0,
+      timeout: false,
+      hasError: false,
+      contentErrors: [],
+    };
+  }
+
+  // Monotonic clock: wall-clock adjustments cannot skew or negate latency
+  const startTime = performance.now();
 
   try {
     // Build Content object
@@ -236,13 +301,12 @@ export async function scan(request: ScanRequest): Promise<ScanResult> {
       opts.metadata = metadata;
     }
 
-    const scanner = new SDKScanner();
-    const data = await scanner.syncScan({ profile_name: profileName }, content, opts);
+    const data = await getSdkScanner().syncScan({ profile_name: profileName }, content, opts);
 
-    const latencyMs = Date.now() - startTime;
+    const latencyMs = Math.round(performance.now() - startTime);
     return mapScanResponse(data, profileName, request, latencyMs);
   } catch (err) {
-    const latencyMs = Date.now() - startTime;
+    const latencyMs = Math.round(performance.now() - startTime);
     return {
       action: "warn",
       severity: "LOW",
@@ -266,6 +330,32 @@ export async function scan(request: ScanRequest): Promise<ScanResult> {
   }
 }
 
+/**
+ * Scan many requests concurrently, with at most maxInFlight awaiting AIRS.
+ * Results are returned in request order. scan() never throws, so a failed
+ * request yields an api_error result without affecting the rest of the batch.
+ * Rejects with a RangeError if maxInFlight is not a positive integer.
+ */
+export async function scanMany(requests: ScanRequest[], maxInFlight = 16): Promise<ScanResult[]> {
+  if (!Number.isInteger(maxInFlight) || maxInFlight < 1) {
+    throw new RangeError(`maxInFlight must be a positive integer, got ${maxInFlight}`);
+  }
+
+  const results: ScanResult[] = new Array(requests.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < requests.length) {
+      const i = next++;
+      results[i] = await scan(requests[i]);
+    }
+  };
+
+  const workerCount = Math.min(maxInFlight, requests.length);
+  await Promise.all(Array.from({ length: workerCount }, worker));
+  return results;
+}
+
 /**
  * Map SDK ScanResponse to plugin ScanResult
  */
@@ -282,72 +372,50 @@ export function mapScanResponse(
   const actionStr = data.action ?? "allow";
 
   // Parse detection flags
+  const pd = data.prompt_detected;
   const promptDetected: PromptDetected = {
-    injection: data.prompt_detected?.injection ?? false,
-    dlp: data.prompt_detected?.dlp ?? false,
-    urlCats: data.prompt_detected?.url_cats ?? false,
-    toxicContent: data.prompt_detected?.toxic_content ?? false,
-    maliciousCode: data.prompt_detected?.malicious_code ?? false,
-    agent: data.prompt_detected?.agent ?? false,
-    topicViolation: data.prompt_detected?.topic_violation ?? false,
+    injection: pd?.injection ?? false,
+    dlp: pd?.dlp ?? false,
+    urlCats: pd?.url_cats ?? false,
+    toxicContent: pd?.toxic_content ?? false,
+    maliciousCode: pd?.malicious_code ?? false,
+    agent: pd?.agent ?? false,
+    topicViolation: pd?.topic_violation ?? false,
   };
 
+  const rd = data.response_detected;
   const responseDetected: ResponseDetected = {
-    dlp: data.response_detected?.dlp ?? false,
-    urlCats: data.response_detected?.url_cats ?? false,
-    dbSecurity: data.response_detected?.db_security ?? false,
-    toxicContent: data.response_detected?.toxic_content ?? false,
-    maliciousCode: data.response_detected?.malicious_code ?? false,
-    agent: data.response_detected?.agent ?? false,
-    ungrounded: data.response_detected?.ungrounded ?? false,
-    topicViolation: data.response_detected?.topic_violation ?? false,
+    dlp: rd?.dlp ?? false,
+    urlCats: rd?.url_cats ?? false,
+    dbSecurity: rd?.db_security ?? false,
+    toxicContent: rd?.toxic_content ?? false,
+    maliciousCode: rd?.malicious_code ?? false,
+    agent: rd?.agent ?? false,
+    ungrounded: rd?.ungrounded ?? false,
+    topicViolation: rd?.topic_violation ?? false,
   };
 
-  // Build categories list
+  // Build categories list (every detection flag maps to exactly one category)
   const categories: string[] = [];
-  if (promptDetected.injection) categories.push("prompt_injection");
-  if (promptDetected.dlp) categories.push("dlp_prompt");
-  if (promptDetected.urlCats) categories.push("url_filtering_prompt");
-  if (promptDetected.toxicContent) categories.push("toxic_content_prompt");
-  if (promptDetected.maliciousCode) categories.push("malicious_code_prompt");
-  if (promptDetected.agent) categories.push("agent_threat_prompt");
-  if (promptDetected.topicViolation) categories.push("topic_violation_prompt");
-  if (responseDetected.dlp) categories.push("dlp_response");
-  if (responseDetected.urlCats) categories.push("url_filtering_response");
-  if (responseDetected.dbSecurity) categories.push("db_security_response");
-  if (responseDetected.toxicContent) categories.push("toxic_content_response");
-  if (responseDetected.maliciousCode) categories.push("malicious_code_response");
-  if (responseDetected.agent) categories.push("agent_threat_response");
-  if (responseDetected.ungrounded) categories.push("ungrounded_response");
-  if (responseDetected.topicViolation) categories.push("topic_violation_response");
-
-  if (categories.length === 0) {
-    categories.push(category === "benign" ? "safe" : category);
+  for (const [flag, label] of PROMPT_CATEGORIES) {
+    if (promptDetected[flag]) categories.push(label);
   }
+  for (const [flag, label] of RESPONSE_CATEGORIES) {
+    if (responseDetected[flag]) categories.push(label);
+  }
+  const anyDetected = categories.length > 0;
 
-  // Determine severity
-  const anyDetected =
-    Object.values(promptDetected).some(Boolean) || Object.values(responseDetected).some(Boolean);
-  let severity: Severity;
-  if (category === "malicious" || actionStr === "block") {
-    severity = "CRITICAL";
-  } else if (category === "suspicious") {
-    severity = "HIGH";
-  } else if (anyDetected) {
-    severity = "MEDIUM";
-  } else {
-    severity = "SAFE";
+  if (!anyDetected) {
+    categories.push(category === "benign" ? "safe" : category);
   }
 
   // Map action
-  let action: Action;
-  if (actionStr === "block") {
-    action = "block";
-  } else if (actionStr === "alert") {
-    action = "warn";
-  } else {
-    action = "allow";
-  }
+  const action = AIRS_ACTION_MAP.get(actionStr) ?? "allow";
+
+  // Determine severity (a block verdict is CRITICAL regardless of category)
+  const severity: Severity =
+    (action === "block" ? "CRITICAL" : CATEGORY_SEVERITY.get(category)) ??
+    (anyDetected ? "MEDIUM" : "SAFE");
 
   // Extract detection details (optional)
   const promptDetectionDetails = parseDetectionDetails(data.prompt_detection_details);
@@ -434,18 +502,30 @@ function parseMaskedData(raw?: SDKMaskedData): MaskedData | undefined {
   };
 }
 
+/** SDK tool detection key -> plugin flag name */
+const TOOL_DETECTION_FIELDS: ReadonlyArray<readonly [string, keyof ToolDetectionFlags]> = [
+  ["injection", "injection"],
+  ["url_cats", "urlCats"],
+  ["dlp", "dlp"],
+  ["db_security", "dbSecurity"],
+  ["toxic_content", "toxicContent"],
+  ["malicious_code", "maliciousCode"],
+  ["agent", "agent"],
+  ["topic_violation", "topicViolation"],
+];
+
 function parseToolDetectionFlags(raw?: Record<string, unknown>): ToolDetectionFlags | undefined {
   if (!raw) return undefined;
   const flags: ToolDetectionFlags = {};
-  if (raw.injection != null) flags.injection = raw.injection as boolean;
-  if (raw.url_cats != null) flags.urlCats = raw.url_cats as boolean;
-  if (raw.dlp != null) flags.dlp = raw.dlp as boolean;
-  if (raw.db_security != null) flags.dbSecurity = raw.db_security as boolean;
-  if (raw.toxic_content != null) flags.toxicContent = raw.toxic_content as boolean;
-  if (raw.malicious_code != null) flags.maliciousCode = raw.malicious_code as boolean;
-  if (raw.agent != null) flags.agent = raw.agent as boolean;
-  if (raw.topic_violation != null) flags.topicViolation = raw.topic_violation as boolean;
-  return Object.keys(flags).length > 0 ? flags : undefined;
+  let found = false;
+  for (const [sdkKey, flag] of TOOL_DETECTION_FIELDS) {
+    const value = raw[sdkKey];
+    if (value != null) {
+      flags[flag] = value as boolean;
+      found = true;
+    }
+  }
+  return found ? flags : undefined;
 }
 
 function parseToolDetected(raw?: SDKToolDetected): ToolDetected | undefined {